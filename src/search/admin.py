@@ -6,5 +6,15 @@ from django.contrib.auth.admin import UserAdmin
 from search.models import Bang
 from search.models import SearchUser
 
-admin.site.register(Bang)
+
+@admin.register(Bang)
+class BangAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    """Admin for bangs which loads the owning user in the same query."""
+
+    list_display = ("shortcut", "url_template", "user")
+    list_select_related = ("user",)
+    search_fields = ("shortcut", "user__username")
+    list_per_page = 50
+
+
 admin.site.register(SearchUser, UserAdmin)
@@ -8,3 +8,7 @@ class SearchConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "search"
+
+    def ready(self) -> None:
+        """Connect the signal handlers of the application."""
+        from search import signals  # noqa: F401, PLC0415
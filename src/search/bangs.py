@@ -1,13 +1,37 @@
 """Bang handling for search shortcuts."""
 
+import time
 from urllib.parse import quote_plus
 
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.models import AnonymousUser
-from django.core.exceptions import ObjectDoesNotExist
 
 from search.models import Bang
 
+# user_id -> (load time, {shortcut: url_template split at "{query}"}),
+# invalidated by search.signals. The signals only reach the current process,
+# the TTL bounds how long other gunicorn workers serve stale bangs.
+_BANG_CACHE: dict[int, tuple[float, dict[str, list[str]]]] = {}
+_BANG_CACHE_TTL = 60.0
+
+
+def _load_user_bangs(user_id: int) -> dict[str, list[str]]:
+    """Load all bangs of a user into the cache and return them."""
+    rows = Bang.objects.filter(user_id=user_id).values_list("shortcut", "url_template")
+    bangs = {shortcut: url_template.split("{query}") for shortcut, url_template in rows}
+    _BANG_CACHE[user_id] = (time.monotonic(), bangs)
+    return bangs
+
+
+def invalidate_user_bangs(user_id: int) -> None:
+    """Drop the cached bangs of a user."""
+    _BANG_CACHE.pop(user_id, None)
+
+
+def clear_bang_cache() -> None:
+    """Drop the cached bangs of all users."""
+    _BANG_CACHE.clear()
+
 
 def resolve_bang(
     user: AbstractUser | AnonymousUser,
@@ -20,20 +44,21 @@ def resolve_bang(
     if not query.startswith("!"):
         return None, None
     # split "!g foo" to "g", "foo"
-    parts = query[1:].split(" ", 1)
-    if len(parts) == 1:
-        shortcut = parts[0]
-        search_query = ""
-    else:
-        shortcut, search_query = parts
+    head, _, search_query = query.partition(" ")
+    shortcut = head[1:]
 
-    try:
-        if isinstance(user, AnonymousUser):
-            return None, search_query
-        bang = Bang.objects.get(shortcut=shortcut, user=user)
-    except ObjectDoesNotExist:
+    if isinstance(user, AnonymousUser):
+        return None, search_query
+
+    cached = _BANG_CACHE.get(user.pk)
+    if cached is None or time.monotonic() - cached[0] > _BANG_CACHE_TTL:
+        bangs = _load_user_bangs(user.pk)
+    else:
+        bangs = cached[1]
+    template_parts = bangs.get(shortcut)
+    if template_parts is None:
         return None, search_query
 
     search_query_escaped = quote_plus(search_query.strip())
-    url = bang.url_template.replace("{query}", search_query_escaped)
+    url = search_query_escaped.join(template_parts)
     return url, search_query
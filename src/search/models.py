@@ -13,6 +13,7 @@ class Bang(models.Model):
         on_delete=models.CASCADE,
         related_name="bangs",
     )
+    user_id: int
     shortcut = models.CharField(max_length=10)
     # e.g. 'https://www.google.com/search?q={query}'
     url_template = models.CharField(max_length=256)
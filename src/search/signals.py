@@ -0,0 +1,40 @@
+"""Signal handlers for the search application."""
+
+from functools import partial
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from search.bangs import invalidate_user_bangs
+from search.models import Bang
+
+
+@receiver(pre_save, sender=Bang)
+def invalidate_previous_owner_bangs(
+    sender: type[Bang], instance: Bang, **kwargs: Any  # noqa: ARG001
+) -> None:
+    """Drop the cached bangs of the previous owner when a bang moves."""
+    if instance.pk is None:
+        return
+    previous_user_id = (
+        Bang.objects.filter(pk=instance.pk).values_list("user_id", flat=True).first()
+    )
+    if previous_user_id is not None and previous_user_id != instance.user_id:
+        transaction.on_commit(partial(invalidate_user_bangs, previous_user_id))
+
+
+@receiver(post_save, sender=Bang)
+@receiver(post_delete, sender=Bang)
+def invalidate_bang_cache(
+    sender: type[Bang], instance: Bang, **kwargs: Any  # noqa: ARG001
+) -> None:
+    """Drop the cached bangs of the owner once the change is committed.
+
+    Invalidating before the commit would let a concurrent search cache the old
+    rows again.
+    """
+    transaction.on_commit(partial(invalidate_user_bangs, instance.user_id))
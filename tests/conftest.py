@@ -15,12 +15,20 @@ if not settings.configured:
 
 from django.contrib.auth import get_user_model
 
+from search.bangs import clear_bang_cache
+
 if TYPE_CHECKING:
     from search.models import SearchUser
 
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def empty_bang_cache() -> None:
+    """Start every test with an empty bang cache."""
+    clear_bang_cache()
+
+
 @pytest.fixture
 def user(db: Any) -> "SearchUser":  # noqa: ARG001
     """Create a test user with database access."""
@@ -15,6 +15,7 @@ if not settings.configured:
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
+from search import bangs
 from search.bangs import resolve_bang
 from search.models import Bang
 
@@ -99,3 +100,94 @@ def test_resolve_bang_strips_whitespace(
     url, query = resolve_bang(user, "!g   test query   ")
     assert url == "https://www.google.com/search?q=test+query"
     assert query == "  test query   "
+
+
+def test_resolve_bang_uses_cache(
+    user: "SearchUser",
+    bang: Bang,  # noqa: ARG001
+    django_assert_num_queries: Any,
+) -> None:
+    """Test that repeated lookups are served from the cache."""
+    resolve_bang(user, "!g first")
+    with django_assert_num_queries(0):
+        url, _ = resolve_bang(user, "!g second")
+    assert url == "https://www.google.com/search?q=second"
+
+
+def test_resolve_bang_cache_invalidated_on_save(
+    user: "SearchUser", bang: Bang, django_capture_on_commit_callbacks: Any
+) -> None:
+    """Test that changing a bang invalidates the cached lookup."""
+    resolve_bang(user, "!g test")
+    with django_capture_on_commit_callbacks(execute=True):
+        bang.url_template = "https://duckduckgo.com/?q={query}"
+        bang.save()
+    url, _ = resolve_bang(user, "!g test")
+    assert url == "https://duckduckgo.com/?q=test"
+
+
+def test_resolve_bang_cache_kept_until_commit(
+    user: "SearchUser", bang: Bang, django_capture_on_commit_callbacks: Any
+) -> None:
+    """Test that the cache is only invalidated once the change is committed."""
+    resolve_bang(user, "!g test")
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        bang.url_template = "https://duckduckgo.com/?q={query}"
+        bang.save()
+    url, _ = resolve_bang(user, "!g test")
+    assert url == "https://www.google.com/search?q=test"
+
+    for callback in callbacks:
+        callback()
+    url, _ = resolve_bang(user, "!g test")
+    assert url == "https://duckduckgo.com/?q=test"
+
+
+def test_resolve_bang_cache_invalidated_for_previous_owner(
+    user: "SearchUser", bang: Bang, django_capture_on_commit_callbacks: Any
+) -> None:
+    """Test that moving a bang to another user invalidates the old owner."""
+    resolve_bang(user, "!g test")
+    user2 = User.objects.create_user(username="testuser2", password="testpass123")
+    with django_capture_on_commit_callbacks(execute=True):
+        bang.user = user2
+        bang.save()
+    url, query = resolve_bang(user, "!g test")
+    assert url is None
+    assert query == "test"
+
+
+def test_resolve_bang_cache_invalidated_on_delete(
+    user: "SearchUser", bang: Bang, django_capture_on_commit_callbacks: Any
+) -> None:
+    """Test that deleting a bang invalidates the cached lookup."""
+    resolve_bang(user, "!g test")
+    with django_capture_on_commit_callbacks(execute=True):
+        bang.delete()
+    url, query = resolve_bang(user, "!g test")
+    assert url is None
+    assert query == "test"
+
+
+def test_resolve_bang_replaces_every_placeholder(user: "SearchUser") -> None:
+    """Test that every {query} placeholder in the template is replaced."""
+    Bang.objects.create(
+        user=user,
+        shortcut="d",
+        url_template="https://example.com/{query}?q={query}",
+    )
+    url, _ = resolve_bang(user, "!d foo bar")
+    assert url == "https://example.com/foo+bar?q=foo+bar"
+
+
+def test_resolve_bang_cache_expires(
+    user: "SearchUser",
+    bang: Bang,  # noqa: ARG001
+    django_assert_num_queries: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cached bangs are reloaded once the TTL has passed."""
+    resolve_bang(user, "!g first")
+    monkeypatch.setattr(bangs, "_BANG_CACHE_TTL", -1.0)
+    with django_assert_num_queries(1):
+        resolve_bang(user, "!g second")
@@ -5,8 +5,10 @@ from django.contrib.auth import get_user_model
 # see ref. below
 UserModel = get_user_model()
 
-if not UserModel.objects.filter(username="admin").exists():
-    user = UserModel.objects.create_user("admin", password="password")  # noqa: S106
-    user.is_superuser = True
-    user.is_staff = True
-    user.save()
+user, created = UserModel.objects.get_or_create(
+    username="admin",
+    defaults={"is_superuser": True, "is_staff": True},
+)
+if created:
+    user.set_password("password")
+    user.save(update_fields=["password"])
@@ -1,7 +1,8 @@
 """Start script used inside the container CMD."""
 
-import multiprocessing
+import math
 import os
+from pathlib import Path
 
 import django
 import gunicorn.app.base
@@ -36,23 +37,56 @@ class GunicornApplication(gunicorn.app.base.BaseApplication):
         return self.application
 
 
+def env_enabled(name: str) -> bool:
+    """Return whether the environment variable is set to a truthy value."""
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def cpu_quota() -> int | None:
+    """Return the CPUs granted by the cgroup v2 CFS quota, None if unlimited."""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        # missing file, no cgroup v2 or "max" as quota
+        return None
+
+
+def physical_cores(cpus: set[int]) -> int:
+    """Count the physical cores behind the given logical CPUs."""
+    topology = "/sys/devices/system/cpu/cpu{}/topology/thread_siblings_list"
+    try:
+        return len({Path(topology.format(cpu)).read_text() for cpu in cpus})
+    except OSError:
+        return len(cpus)
+
+
 def number_of_workers() -> int:
-    """Calculate the optimal number of Gunicorn workers based on CPU count."""
-    return multiprocessing.cpu_count() + 1
+    """Calculate the number of Gunicorn workers from the usable CPUs.
+
+    The CPU affinity only covers cpusets, the CFS quota of the container
+    (``--cpus``) is read from cgroup v2. SMT siblings are counted as one core,
+    the worker threads take care of the requests waiting on I/O.
+    """
+    workers = physical_cores(os.sched_getaffinity(0))
+    quota = cpu_quota()
+    if quota is not None:
+        workers = min(workers, quota)
+    return max(2, workers)
 
 
 def start_gunicorn() -> None:
     """Start the Gunicorn server with Django application."""
-    reload_enabled = os.getenv("GUNICORN_RELOAD", "").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
+    reload_enabled = env_enabled("GUNICORN_RELOAD")
     options: dict[str, str | int | bool] = {
         "bind": "0.0.0.0:8000",
         "reload": reload_enabled,
         "workers": number_of_workers(),
+        "worker_class": "gthread",
+        "threads": 8,
+        "keepalive": 5,
+        "max_requests": 1000,
+        "max_requests_jitter": 100,
     }
     app = get_wsgi_application()
     GunicornApplication(app=app, options=options).run()
@@ -67,19 +101,20 @@ def run_migrations() -> None:
 def setup_admin() -> None:
     """Create default admin user if it doesn't exist."""
     user_model = get_user_model()
-    if not user_model.objects.filter(username="admin").exists():
-        user = user_model.objects.create_user(
-            "admin", password="password"  # noqa: S106
-        )
-        user.is_superuser = True
-        user.is_staff = True
-        user.save()
+    user, created = user_model.objects.get_or_create(
+        username="admin",
+        defaults={"is_superuser": True, "is_staff": True},
+    )
+    if created:
+        user.set_password("password")
+        user.save(update_fields=["password"])
 
 
 def main() -> None:
     """Run migrations, setup admin user, and start the Gunicorn server."""
     run_migrations()
-    setup_admin()
+    if not env_enabled("SKIP_ADMIN_SETUP"):
+        setup_admin()
     start_gunicorn()
 
 